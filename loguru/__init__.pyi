@@ -89,6 +89,7 @@ For more details, go to official |documentation of loguru-mypy|_.
 
 import sys
 from asyncio import AbstractEventLoop
+from concurrent.futures import Executor
 from datetime import datetime, time, timedelta
 from logging import Handler
 from types import TracebackType
@@ -222,6 +223,7 @@ class _HandlerConfig(TypedDict, total=False):
     backtrace: bool
     diagnose: bool
     enqueue: bool
+    defer_exceptions: bool
     catch: bool
 
 class LevelConfig(TypedDict, total=False):
@@ -246,6 +248,7 @@ class Logger:
         backtrace: bool = ...,
         diagnose: bool = ...,
         enqueue: bool = ...,
+        defer_exceptions: bool = ...,
         catch: bool = ...
     ) -> int: ...
     @overload
@@ -261,6 +264,7 @@ class Logger:
         backtrace: bool = ...,
         diagnose: bool = ...,
         enqueue: bool = ...,
+        defer_exceptions: bool = ...,
         catch: bool = ...,
         loop: Optional[AbstractEventLoop] = ...
     ) -> int: ...
@@ -277,12 +281,20 @@ class Logger:
         backtrace: bool = ...,
         diagnose: bool = ...,
         enqueue: bool = ...,
+        defer_exceptions: bool = ...,
         catch: bool = ...,
         rotation: Optional[Union[str, int, time, timedelta, RotationFunction]] = ...,
         retention: Optional[Union[str, int, timedelta, RetentionFunction]] = ...,
         compression: Optional[Union[str, CompressionFunction]] = ...,
         delay: bool = ...,
         watch: bool = ...,
+        flush_interval: Optional[Union[str, int, float, timedelta]] = ...,
+        flush_bytes: Optional[Union[str, int]] = ...,
+        flush_level: Optional[Union[str, int]] = ...,
+        size_resync: Optional[Union[str, int, float, timedelta]] = ...,
+        background: Optional[Union[bool, str, Executor]] = ...,
+        background_backlog: int = ...,
+        background_callback: Optional[Callable[[str, Optional[BaseException]], None]] = ...,
         mode: str = ...,
         buffering: int = ...,
         encoding: str = ...,
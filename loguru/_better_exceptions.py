@@ -92,6 +92,26 @@ class SyntaxHighlighter:
             return
 
 
+class FrameSnapshot:
+    __slots__ = ("f_code", "f_lineno", "f_locals", "f_globals", "f_back")
+
+    def __init__(self, frame, f_back, copy_variables):
+        self.f_code = frame.f_code
+        self.f_lineno = frame.f_lineno
+        self.f_locals = dict(frame.f_locals) if copy_variables else {}
+        self.f_globals = frame.f_globals if copy_variables else {}
+        self.f_back = f_back
+
+
+class TracebackSnapshot:
+    __slots__ = ("tb_frame", "tb_lineno", "tb_next")
+
+    def __init__(self, tb_frame, tb_lineno):
+        self.tb_frame = tb_frame
+        self.tb_lineno = tb_lineno
+        self.tb_next = None
+
+
 class ExceptionFormatter:
     _default_theme = {
         "introduction": "\x1b[33m\x1b[1m{}\x1b[0m",
@@ -344,7 +364,57 @@ class ExceptionFormatter:
 
             yield frame
 
-    def _format_exception(self, value, tb, *, seen=None, is_first=False, from_decorator=False):
+    def _snapshot_frame(self, frame, snapshots, *, with_parents):
+        # The frames still running will be modified once the logging call returns, so we copy
+        # the few attributes needed. Only the locals are copied, globals are kept by reference.
+        if frame is None:
+            return None
+
+        if id(frame) in snapshots:
+            return snapshots[id(frame)]
+
+        parents = []
+
+        if with_parents:
+            parent = frame.f_back
+            while parent is not None and id(parent) not in snapshots:
+                parents.append(parent)
+                parent = parent.f_back
+            f_back = None if parent is None else snapshots[id(parent)]
+            for parent in reversed(parents):
+                f_back = FrameSnapshot(parent, f_back, self._diagnose)
+                snapshots[id(parent)] = f_back
+        else:
+            f_back = None
+
+        snapshot = FrameSnapshot(frame, f_back, self._diagnose)
+        snapshots[id(frame)] = snapshot
+        return snapshot
+
+    def _snapshot_traceback(self, tb, snapshots, *, with_parents):
+        head = previous = None
+
+        while tb is not None:
+            frame = self._snapshot_frame(tb.tb_frame, snapshots, with_parents=with_parents)
+            current = TracebackSnapshot(frame, tb.tb_lineno)
+            if previous is None:
+                head = current
+            else:
+                previous.tb_next = current
+            previous = current
+            with_parents = False
+            tb = tb.tb_next
+
+        return head
+
+    def _get_traceback(self, exception, tracebacks):
+        if tracebacks is None:
+            return exception.__traceback__
+        return tracebacks.get(id(exception))
+
+    def _format_exception(
+        self, value, tb, *, seen=None, is_first=False, from_decorator=False, tracebacks=None
+    ):
         # Implemented from built-in traceback module:
         # https://github.com/python/cpython/blob/a5b76167/Lib/traceback.py#L468
         exc_type, exc_value, exc_traceback = type(value), value, tb
@@ -357,7 +427,10 @@ class ExceptionFormatter:
         if exc_value:
             if exc_value.__cause__ is not None and id(exc_value.__cause__) not in seen:
                 for text in self._format_exception(
-                    exc_value.__cause__, exc_value.__cause__.__traceback__, seen=seen
+                    exc_value.__cause__,
+                    self._get_traceback(exc_value.__cause__, tracebacks),
+                    seen=seen,
+                    tracebacks=tracebacks,
                 ):
                     yield text
                 cause = "The above exception was the direct cause of the following exception:"
@@ -374,7 +447,10 @@ class ExceptionFormatter:
                 and not exc_value.__suppress_context__
             ):
                 for text in self._format_exception(
-                    exc_value.__context__, exc_value.__context__.__traceback__, seen=seen
+                    exc_value.__context__,
+                    self._get_traceback(exc_value.__context__, tracebacks),
+                    seen=seen,
+                    tracebacks=tracebacks,
                 ):
                     yield text
                 context = "During handling of the above exception, another exception occurred:"
@@ -433,5 +509,36 @@ class ExceptionFormatter:
 
         yield "".join(frames_lines)
 
-    def format_exception(self, type_, value, tb, *, from_decorator=False):
-        yield from self._format_exception(value, tb, is_first=True, from_decorator=from_decorator)
+    def snapshot_exception(self, value, tb, *, from_decorator=False):
+        """Copy the frames data required to call "format_exception()" later from another thread.
+
+        Returns the snapshot of the traceback and a dict mapping the identifiers of chained
+        exceptions to the snapshot of their own traceback.
+        """
+        snapshots = {}
+        with_parents = self._backtrace or from_decorator
+        traceback_ = self._snapshot_traceback(tb, snapshots, with_parents=with_parents)
+
+        tracebacks = {}
+        seen = {id(value)}
+        pending = [value]
+
+        while pending:
+            exception = pending.pop()
+            if exception is None:
+                continue
+            for chained in (exception.__cause__, exception.__context__):
+                if chained is None or id(chained) in seen:
+                    continue
+                seen.add(id(chained))
+                tracebacks[id(chained)] = self._snapshot_traceback(
+                    chained.__traceback__, snapshots, with_parents=False
+                )
+                pending.append(chained)
+
+        return traceback_, tracebacks
+
+    def format_exception(self, type_, value, tb, *, from_decorator=False, tracebacks=None):
+        yield from self._format_exception(
+            value, tb, is_first=True, from_decorator=from_decorator, tracebacks=tracebacks
+        )
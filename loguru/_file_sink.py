@@ -1,3 +1,4 @@
+import codecs
 import datetime
 import decimal
 import glob
@@ -5,12 +6,20 @@ import numbers
 import os
 import shutil
 import string
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from functools import partial
-from stat import ST_DEV, ST_INO
+from stat import ST_DEV, ST_INO, ST_SIZE
 
 from . import _string_parsers as string_parsers
 from ._ctime_functions import get_ctime, set_ctime
 from ._datetime import aware_now
+from ._locks_machinery import create_sink_lock
 
 
 def generate_rename_path(root, ext, creation_time):
@@ -37,6 +46,150 @@ class FileDateFormatter:
         return self.datetime.__format__(spec)
 
 
+class Flusher:
+    def __init__(self, sink, interval):
+        self._sink = sink
+        self._interval = interval
+        self._event = threading.Event()
+        self._thread = None
+
+    def ensure_running(self):
+        # The thread is lazily (re-)started because it does not survive a fork.
+        if self._thread is None or not self._thread.is_alive():
+            self._event.clear()
+            self._thread = threading.Thread(
+                target=self._flush_periodically, daemon=True, name="loguru-flusher"
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def _flush_periodically(self):
+        while not self._event.wait(self._interval):
+            self._sink.flush()
+
+
+def cleanup_file(path, compression_function, retention_function, glob_patterns, active_path=None):
+    if compression_function is not None and path is not None:
+        compression_function(path)
+
+    if retention_function is not None:
+        logs = {
+            file
+            for pattern in glob_patterns
+            for file in glob.glob(pattern)
+            if os.path.isfile(file) and file != active_path
+        }
+        retention_function(list(logs))
+
+
+class Worker:
+    def __init__(self, executor, backlog, callback):
+        self._executor_factory = None
+        self._executor = None
+        self._backlog = backlog
+        self._callback = callback
+        self._semaphore = None
+        self._futures = set()
+        self._owner_pid = None
+
+        if isinstance(executor, Executor):
+            self._executor = executor
+        elif executor == "thread":
+            self._executor_factory = partial(ThreadPoolExecutor, max_workers=1)
+        elif executor == "process":
+            self._executor_factory = partial(ProcessPoolExecutor, max_workers=1)
+        else:
+            raise ValueError("Invalid background worker: '%s'" % executor)
+
+    def submit(self, function, path, *args):
+        if self._owner_pid != os.getpid():
+            # Also needed after a fork, since threads of the executor are not inherited.
+            self._owner_pid = os.getpid()
+            self._semaphore = threading.BoundedSemaphore(self._backlog)
+            self._futures = set()
+            if self._executor_factory is not None:
+                self._executor = self._executor_factory()
+
+        self._semaphore.acquire()
+
+        try:
+            future = self._executor.submit(function, path, *args)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        self._futures.add(future)
+        future.add_done_callback(partial(self._on_done, path=path))
+
+    def stop(self):
+        if self._owner_pid != os.getpid():
+            return
+
+        wait_futures(list(self._futures))
+
+        if self._executor_factory is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        self._owner_pid = None
+
+    def _on_done(self, future, path):
+        self._futures.discard(future)
+        self._semaphore.release()
+
+        exception = future.exception()
+
+        if self._callback is not None:
+            try:
+                self._callback(path, exception)
+            except Exception as e:
+                self._print_error(path, e)
+        elif exception is not None:
+            self._print_error(path, exception)
+
+    @staticmethod
+    def _print_error(path, exception):
+        if not sys.stderr:
+            return
+
+        try:
+            sys.stderr.write("--- Logging error in Loguru file sink worker ---\n")
+            sys.stderr.write("File was: %s\n" % path)
+            traceback.print_exception(
+                type(exception), exception, exception.__traceback__, None, sys.stderr
+            )
+            sys.stderr.write("--- End of logging error ---\n")
+        except OSError:
+            pass
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_semaphore"] = None
+        state["_futures"] = set()
+        state["_owner_pid"] = None
+        if self._executor_factory is not None:
+            state["_executor"] = None
+        return state
+
+
+def encoded_length(text, encoding, ascii_compatible, translate_newlines):
+    # Avoid encoding the text if not necessary, "isascii()" is a constant time check.
+    if ascii_compatible and text.isascii():
+        length = len(text)
+    else:
+        length = len(text.encode(encoding, "replace"))
+
+    if translate_newlines:
+        length += text.count("\n")
+
+    return length
+
+
 class Compression:
     @staticmethod
     def add_compress(path_in, path_out, opener, **kwargs):
@@ -63,7 +216,20 @@ class Compression:
             root, ext_before = os.path.splitext(path_in)
             renamed_path = generate_rename_path(root, ext_before + ext, creation_time)
             os.rename(path_out, renamed_path)
-        compress_function(path_in, path_out)
+
+        # The archive is first written to a hidden directory so that it never appears partially
+        # written under its final name (for example if the process is killed in the meantime).
+        tmp_dir = tempfile.mkdtemp(prefix=".loguru-", dir=os.path.dirname(path_out) or None)
+        path_tmp = os.path.join(tmp_dir, os.path.basename(path_out))
+
+        try:
+            compress_function(path_in, path_tmp)
+            creation_time = get_ctime(path_tmp)
+            os.replace(path_tmp, path_out)
+            set_ctime(path_out, creation_time)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
         os.remove(path_in)
 
 
@@ -100,10 +266,10 @@ class Rotation:
     def forward_interval(t, interval):
         return t + interval
 
-    @staticmethod
-    def rotation_size(message, file, size_limit):
-        file.seek(0, 2)
-        return file.tell() + len(message) > size_limit
+    class RotationSize:
+        # The size of the file is tracked by the sink, there is no need to query the file system.
+        def __init__(self, size_limit):
+            self.size_limit = size_limit
 
     class RotationTime:
         def __init__(self, step_forward, time_init=None):
@@ -167,6 +333,13 @@ class FileSink:
         compression=None,
         delay=False,
         watch=False,
+        flush_interval=None,
+        flush_bytes=None,
+        flush_level=None,
+        size_resync=None,
+        background=None,
+        background_backlog=16,
+        background_callback=None,
         mode="a",
         buffering=1,
         encoding="utf8",
@@ -176,11 +349,14 @@ class FileSink:
 
         self._kwargs = {**kwargs, "mode": mode, "buffering": buffering, "encoding": self.encoding}
         self._path = str(path)
+        self._lock = create_sink_lock()
 
         self._glob_patterns = self._make_glob_patterns(self._path)
         self._rotation_function = self._make_rotation_function(rotation)
+        self._rotation_size = None
         self._retention_function = self._make_retention_function(retention)
         self._compression_function = self._make_compression_function(compression)
+        self._worker = self._make_worker(background, background_backlog, background_callback)
 
         self._file = None
         self._file_path = None
@@ -189,30 +365,101 @@ class FileSink:
         self._file_dev = -1
         self._file_ino = -1
 
+        self._buffer = None
+        self._buffer_size = 0
+        self._flush_size = None
+        self._flush_level = None
+        self._flusher = None
+        self._encoded_length = None
+
+        self._file_size = 0
+        self._size_resync = None
+        self._size_resync_time = 0
+
+        if flush_interval is not None or flush_bytes is not None or flush_level is not None:
+            self._buffer = []
+            self._flush_size = self._make_flush_size(flush_bytes)
+            self._flush_level = self._make_flush_level(flush_level)
+            interval = self._make_interval(flush_interval, "flush interval")
+            if interval is not None:
+                self._flusher = Flusher(self, interval)
+
+        self._size_resync = self._make_interval(size_resync, "size resync")
+
+        if isinstance(self._rotation_function, Rotation.RotationSize):
+            self._rotation_size = self._rotation_function.size_limit
+
+        if self._buffer is not None or self._rotation_size is not None:
+            self._encoded_length = self._make_encoded_length_function(
+                self.encoding, self._kwargs.get("newline", None)
+            )
+
         if not delay:
             path = self._create_path()
             self._create_dirs(path)
             self._create_file(path)
 
     def write(self, message):
-        if self._file is None:
-            path = self._create_path()
-            self._create_dirs(path)
-            self._create_file(path)
-
-        if self._watch:
-            self._reopen_if_needed()
+        with self._lock:
+            if self._file is None:
+                path = self._create_path()
+                self._create_dirs(path)
+                self._create_file(path)
 
-        if self._rotation_function is not None and self._rotation_function(message, self._file):
-            self._terminate_file(is_rotating=True)
+            if self._watch:
+                self._reopen_if_needed()
 
-        self._file.write(message)
+            if self._encoded_length is None:
+                size = 0
+            else:
+                size = self._encoded_length(message)
+
+            if self._rotation_size is not None:
+                if self._size_resync is not None:
+                    self._resync_size_if_needed()
+                if self._file_size + size > self._rotation_size:
+                    self._terminate_file(is_rotating=True)
+            elif self._rotation_function is not None:
+                if self._buffer and not isinstance(self._rotation_function, Rotation.RotationTime):
+                    # The rotation function may inspect the file, it must be up to date.
+                    self._flush_buffer()
+                if self._rotation_function(message, self._file):
+                    self._terminate_file(is_rotating=True)
+
+            self._file_size += size
+
+            if self._buffer is None:
+                self._file.write(message)
+                return
+
+            if not self._buffer and self._flusher is not None:
+                self._flusher.ensure_running()
+
+            self._buffer.append(message)
+            self._buffer_size += size
+
+            if self._buffer_size >= self._flush_size or (
+                self._flush_level is not None and message.record["level"].no >= self._flush_level
+            ):
+                self._flush_buffer()
+
+    def flush(self):
+        with self._lock:
+            if self._buffer:
+                self._flush_buffer()
 
     def stop(self):
-        if self._watch:
-            self._reopen_if_needed()
+        if self._flusher is not None:
+            self._flusher.stop()
+
+        with self._lock:
+            if self._watch:
+                self._reopen_if_needed()
+
+            self._terminate_file(is_rotating=False)
 
-        self._terminate_file(is_rotating=False)
+        if self._worker is not None:
+            self._worker.stop()
 
     async def complete(self):
         pass
@@ -229,13 +476,33 @@ class FileSink:
         self._file = open(path, **self._kwargs)
         self._file_path = path
 
-        if self._watch:
+        if self._watch or self._rotation_size is not None:
             fileno = self._file.fileno()
             result = os.fstat(fileno)
             self._file_dev = result[ST_DEV]
             self._file_ino = result[ST_INO]
+            self._file_size = result[ST_SIZE]
+            self._size_resync_time = time.monotonic()
+
+    def _resync_size_if_needed(self):
+        # Other processes may write to the same file, so its actual size is regularly checked.
+        now = time.monotonic()
+        if now - self._size_resync_time < self._size_resync:
+            return
+        self._file.flush()
+        self._file_size = os.fstat(self._file.fileno())[ST_SIZE] + self._buffer_size
+        self._size_resync_time = now
+
+    def _flush_buffer(self):
+        self._file.write("".join(self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+        self._buffer_size = 0
 
     def _close_file(self):
+        if self._buffer:
+            self._flush_buffer()
+
         self._file.flush()
         self._file.close()
 
@@ -243,6 +510,7 @@ class FileSink:
         self._file_path = None
         self._file_dev = -1
         self._file_ino = -1
+        self._file_size = 0
 
     def _reopen_if_needed(self):
         # Implemented based on standard library:
@@ -279,23 +547,41 @@ class FileSink:
                 os.rename(old_path, renamed_path)
                 old_path = renamed_path
 
-        if is_rotating or self._rotation_function is None:
-            if self._compression_function is not None and old_path is not None:
-                self._compression_function(old_path)
+        has_cleanup = self._compression_function is not None or self._retention_function is not None
+        should_cleanup = has_cleanup and (is_rotating or self._rotation_function is None)
 
-            if self._retention_function is not None:
-                logs = {
-                    file
-                    for pattern in self._glob_patterns
-                    for file in glob.glob(pattern)
-                    if os.path.isfile(file)
-                }
-                self._retention_function(list(logs))
+        if should_cleanup and self._worker is None:
+            cleanup_file(
+                old_path, self._compression_function, self._retention_function, self._glob_patterns
+            )
 
         if is_rotating:
             self._create_file(new_path)
             set_ctime(new_path, datetime.datetime.now().timestamp())
 
+        if should_cleanup and self._worker is not None:
+            # The new file is already opened, so logging can go on while the old one is processed.
+            self._worker.submit(
+                cleanup_file,
+                old_path,
+                self._compression_function,
+                self._retention_function,
+                self._glob_patterns,
+                new_path if is_rotating else None,
+            )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_flusher"] = None if self._flusher is None else self._flusher._interval
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = create_sink_lock()
+        if self._flusher is not None:
+            self._flusher = Flusher(self, self._flusher)
+
     @staticmethod
     def _make_glob_patterns(path):
         formatter = string.Formatter()
@@ -334,7 +620,7 @@ class FileSink:
                 return Rotation.RotationTime(step_forward, time)
             raise ValueError("Cannot parse rotation from: '%s'" % rotation)
         elif isinstance(rotation, (numbers.Real, decimal.Decimal)):
-            return partial(Rotation.rotation_size, size_limit=rotation)
+            return Rotation.RotationSize(rotation)
         elif isinstance(rotation, datetime.time):
             return Rotation.RotationTime(Rotation.forward_day, rotation)
         elif isinstance(rotation, datetime.timedelta):
@@ -367,6 +653,103 @@ class FileSink:
                 "Cannot infer retention for objects of type: '%s'" % type(retention).__name__
             )
 
+    @staticmethod
+    def _make_interval(interval, description):
+        if interval is None:
+            return None
+        elif isinstance(interval, str):
+            duration = string_parsers.parse_duration(interval)
+            if duration is None:
+                raise ValueError("Cannot parse %s from: '%s'" % (description, interval))
+            return FileSink._make_interval(duration, description)
+        elif isinstance(interval, datetime.timedelta):
+            return FileSink._make_interval(interval.total_seconds(), description)
+        elif isinstance(interval, (numbers.Real, decimal.Decimal)):
+            if interval <= 0:
+                raise ValueError(
+                    "Invalid %s, it should be a positive duration, not: '%s'"
+                    % (description, interval)
+                )
+            return float(interval)
+        else:
+            raise TypeError(
+                "Cannot infer %s for objects of type: '%s'" % (description, type(interval).__name__)
+            )
+
+    @staticmethod
+    def _make_worker(background, backlog, callback):
+        if background is None or background is False:
+            return None
+        elif background is True:
+            return FileSink._make_worker("thread", backlog, callback)
+        elif not isinstance(background, (str, Executor)):
+            raise TypeError(
+                "Cannot infer background worker for objects of type: '%s'"
+                % type(background).__name__
+            )
+        elif not isinstance(backlog, int) or backlog < 1:
+            raise ValueError(
+                "Invalid background backlog, it should be a positive integer, not: '%s'" % backlog
+            )
+        elif callback is not None and not callable(callback):
+            raise TypeError(
+                "Invalid background callback, it should be a function, not: '%s'"
+                % type(callback).__name__
+            )
+        return Worker(background, backlog, callback)
+
+    @staticmethod
+    def _make_flush_size(flush_bytes):
+        if flush_bytes is None:
+            return 64 * 1024
+        elif isinstance(flush_bytes, str):
+            size = string_parsers.parse_size(flush_bytes)
+            if size is None:
+                raise ValueError("Cannot parse flush size from: '%s'" % flush_bytes)
+            return FileSink._make_flush_size(size)
+        elif isinstance(flush_bytes, (numbers.Real, decimal.Decimal)):
+            return flush_bytes
+        else:
+            raise TypeError(
+                "Cannot infer flush size for objects of type: '%s'" % type(flush_bytes).__name__
+            )
+
+    @staticmethod
+    def _make_flush_level(flush_level):
+        if flush_level is None:
+            return None
+        elif isinstance(flush_level, int):
+            return flush_level
+        else:
+            raise TypeError(
+                "Invalid flush level, it should be an integer or a string, not: '%s'"
+                % type(flush_level).__name__
+            )
+
+    @staticmethod
+    def _make_encoded_length_function(encoding, newline):
+        try:
+            name = codecs.lookup(encoding).name
+        except LookupError:
+            name = None
+
+        ascii_compatible = name in ("ascii", "utf-8", "iso8859-1", "iso8859-15", "cp1252")
+
+        if not hasattr(str, "isascii"):  # Python < 3.7
+            ascii_compatible = False
+
+        if newline is None:
+            translate_newlines = os.linesep == "\r\n"
+        else:
+            translate_newlines = newline == "\r\n"
+
+        return partial(
+            encoded_length,
+            encoding=encoding,
+            ascii_compatible=ascii_compatible,
+            translate_newlines=translate_newlines,
+        )
+
     @staticmethod
     def _make_compression_function(compression):
         if compression is None:
@@ -3,6 +3,7 @@ import json
 import multiprocessing
 import os
 import threading
+from collections import deque
 from contextlib import contextmanager
 from threading import Thread
 
@@ -41,6 +42,7 @@ class Handler:
         colorize,
         serialize,
         enqueue,
+        defer_exceptions,
         error_interceptor,
         exception_formatter,
         id_,
@@ -55,6 +57,7 @@ class Handler:
         self._colorize = colorize
         self._serialize = serialize
         self._enqueue = enqueue
+        self._defer_exceptions = enqueue and defer_exceptions
         self._error_interceptor = error_interceptor
         self._exception_formatter = exception_formatter
         self._id = id_
@@ -72,6 +75,7 @@ class Handler:
         self._confirmation_lock = None
         self._owner_process_pid = None
         self._thread = None
+        self._deferred = None
 
         if self._is_formatter_dynamic:
             if self._colorize:
@@ -90,6 +94,7 @@ class Handler:
             self._confirmation_event = multiprocessing.Event()
             self._confirmation_lock = multiprocessing.Lock()
             self._owner_process_pid = os.getpid()
+            self._deferred = deque()
             self._thread = Thread(
                 target=self._queued_writer, daemon=True, name="loguru-writer-%d" % self._id
             )
@@ -126,67 +131,43 @@ class Handler:
 
             if self._is_formatter_dynamic:
                 dynamic_format = self._formatter(record)
-
-            formatter_record = record.copy()
+            else:
+                dynamic_format = None
 
             if not record["exception"]:
-                formatter_record["exception"] = ""
+                exception = ""
+            elif self._defer_exceptions and self._owner_process_pid == os.getpid():
+                # The costly formatting of the exception is done later by the worker thread. The
+                # deferred data never leaves the current process, only a marker is enqueued.
+                _, value, tb = record["exception"]
+                snapshot = self._exception_formatter.snapshot_exception(
+                    value, tb, from_decorator=from_decorator
+                )
+                deferred = (
+                    record,
+                    level_id,
+                    from_decorator,
+                    is_raw,
+                    colored_message,
+                    dynamic_format,
+                    snapshot,
+                )
+
+                with self._protected_lock():
+                    if self._stopped:
+                        return
+                    self._deferred.append(deferred)
+                    self._queue.put(False)
+                return
             else:
                 type_, value, tb = record["exception"]
                 formatter = self._exception_formatter
                 lines = formatter.format_exception(type_, value, tb, from_decorator=from_decorator)
-                formatter_record["exception"] = "".join(lines)
-
-            if colored_message is not None and colored_message.stripped != record["message"]:
-                colored_message = None
-
-            if is_raw:
-                if colored_message is None or not self._colorize:
-                    formatted = record["message"]
-                else:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    formatted = colored_message.colorize(ansi_level)
-            elif self._is_formatter_dynamic:
-                if not self._colorize:
-                    precomputed_format = self._memoize_dynamic_format(dynamic_format)
-                    formatted = precomputed_format.format_map(formatter_record)
-                elif colored_message is None:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    _, precomputed_format = self._memoize_dynamic_format(dynamic_format, ansi_level)
-                    formatted = precomputed_format.format_map(formatter_record)
-                else:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    formatter, precomputed_format = self._memoize_dynamic_format(
-                        dynamic_format, ansi_level
-                    )
-                    coloring_message = formatter.make_coloring_message(
-                        record["message"], ansi_level=ansi_level, colored_message=colored_message
-                    )
-                    formatter_record["message"] = coloring_message
-                    formatted = precomputed_format.format_map(formatter_record)
+                exception = "".join(lines)
 
-            else:
-                if not self._colorize:
-                    precomputed_format = self._decolorized_format
-                    formatted = precomputed_format.format_map(formatter_record)
-                elif colored_message is None:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    precomputed_format = self._precolorized_formats[level_id]
-                    formatted = precomputed_format.format_map(formatter_record)
-                else:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    precomputed_format = self._precolorized_formats[level_id]
-                    coloring_message = self._formatter.make_coloring_message(
-                        record["message"], ansi_level=ansi_level, colored_message=colored_message
-                    )
-                    formatter_record["message"] = coloring_message
-                    formatted = precomputed_format.format_map(formatter_record)
-
-            if self._serialize:
-                formatted = self._serialize_record(formatted, record)
-
-            str_record = Message(formatted)
-            str_record.record = record
+            str_record = self._format_message(
+                record, level_id, is_raw, colored_message, dynamic_format, exception
+            )
 
             with self._protected_lock():
                 if self._stopped:
@@ -200,6 +181,76 @@ class Handler:
                 raise
             self._error_interceptor.print(record)
 
+    def _format_message(self, record, level_id, is_raw, colored_message, dynamic_format, exception):
+        formatter_record = record.copy()
+        formatter_record["exception"] = exception
+
+        if colored_message is not None and colored_message.stripped != record["message"]:
+            colored_message = None
+
+        if is_raw:
+            if colored_message is None or not self._colorize:
+                formatted = record["message"]
+            else:
+                ansi_level = self._levels_ansi_codes[level_id]
+                formatted = colored_message.colorize(ansi_level)
+        elif self._is_formatter_dynamic:
+            if not self._colorize:
+                precomputed_format = self._memoize_dynamic_format(dynamic_format)
+                formatted = precomputed_format.format_map(formatter_record)
+            elif colored_message is None:
+                ansi_level = self._levels_ansi_codes[level_id]
+                _, precomputed_format = self._memoize_dynamic_format(dynamic_format, ansi_level)
+                formatted = precomputed_format.format_map(formatter_record)
+            else:
+                ansi_level = self._levels_ansi_codes[level_id]
+                formatter, precomputed_format = self._memoize_dynamic_format(
+                    dynamic_format, ansi_level
+                )
+                coloring_message = formatter.make_coloring_message(
+                    record["message"], ansi_level=ansi_level, colored_message=colored_message
+                )
+                formatter_record["message"] = coloring_message
+                formatted = precomputed_format.format_map(formatter_record)
+
+        else:
+            if not self._colorize:
+                precomputed_format = self._decolorized_format
+                formatted = precomputed_format.format_map(formatter_record)
+            elif colored_message is None:
+                ansi_level = self._levels_ansi_codes[level_id]
+                precomputed_format = self._precolorized_formats[level_id]
+                formatted = precomputed_format.format_map(formatter_record)
+            else:
+                ansi_level = self._levels_ansi_codes[level_id]
+                precomputed_format = self._precolorized_formats[level_id]
+                coloring_message = self._formatter.make_coloring_message(
+                    record["message"], ansi_level=ansi_level, colored_message=colored_message
+                )
+                formatter_record["message"] = coloring_message
+                formatted = precomputed_format.format_map(formatter_record)
+
+        if self._serialize:
+            formatted = self._serialize_record(formatted, record)
+
+        str_record = Message(formatted)
+        str_record.record = record
+
+        return str_record
+
+    def _format_deferred(
+        self, record, level_id, from_decorator, is_raw, colored_message, dynamic_format, snapshot
+    ):
+        type_, value, _ = record["exception"]
+        tb, tracebacks = snapshot
+        lines = self._exception_formatter.format_exception(
+            type_, value, tb, from_decorator=from_decorator, tracebacks=tracebacks
+        )
+        exception = "".join(lines)
+        return self._format_message(
+            record, level_id, is_raw, colored_message, dynamic_format, exception
+        )
+
     def stop(self):
         with self._protected_lock():
             self._stopped = True
@@ -304,14 +355,24 @@ class Handler:
                 self._confirmation_event.set()
                 continue
 
+            if message is False:
+                # The message needs to be formatted, its data was stored by "emit()" beforehand.
+                deferred = self._deferred.popleft()
+                record = deferred[0]
+            else:
+                deferred = None
+                record = message.record
+
             with lock:
                 try:
+                    if deferred is not None:
+                        message = self._format_deferred(*deferred)
                     self._sink.write(message)
                 except Exception:
                     if not self._error_interceptor.should_catch():
                         self._confirmation_event.set()
                         raise
-                    self._error_interceptor.print(message.record)
+                    self._error_interceptor.print(record)
 
     def __getstate__(self):
         state = self.__dict__.copy()
@@ -322,6 +383,7 @@ class Handler:
             state["_sink"] = None
             state["_thread"] = None
             state["_owner_process"] = None
+            state["_deferred"] = None
         return state
 
     def __setstate__(self, state):
@@ -10,14 +10,19 @@ if not hasattr(os, "register_at_fork"):
     def create_handler_lock():
         return threading.Lock()
 
+    def create_sink_lock():
+        return threading.Lock()
+
 else:
     # While forking, we need to sanitize all locks to make sure the child process doesn't run into
     # a deadlock (if a lock already acquired is inherited) and to protect sink from corrupted state.
     # It's very important to acquire logger locks before handlers one to prevent possible deadlock
-    # while 'remove()' is called for example.
+    # while 'remove()' is called for example. Likewise, sink locks are always acquired while the
+    # handler lock is already held, so they must come last.
 
     logger_locks = weakref.WeakSet()
     handler_locks = weakref.WeakSet()
+    sink_locks = weakref.WeakSet()
 
     def acquire_locks():
         for lock in logger_locks:
@@ -26,6 +31,9 @@ else:
         for lock in handler_locks:
             lock.acquire()
 
+        for lock in sink_locks:
+            lock.acquire()
+
     def release_locks():
         for lock in logger_locks:
             lock.release()
@@ -33,6 +41,9 @@ else:
         for lock in handler_locks:
             lock.release()
 
+        for lock in sink_locks:
+            lock.release()
+
     os.register_at_fork(
         before=acquire_locks,
         after_in_parent=release_locks,
@@ -48,3 +59,8 @@ else:
         lock = threading.Lock()
         handler_locks.add(lock)
         return lock
+
+    def create_sink_lock():
+        lock = threading.Lock()
+        sink_locks.add(lock)
+        return lock
@@ -19,6 +19,7 @@
 .. |Any| replace:: :obj:`~typing.Any`
 .. |str| replace:: :class:`str`
 .. |int| replace:: :class:`int`
+.. |float| replace:: :class:`float`
 .. |bool| replace:: :class:`bool`
 .. |tuple| replace:: :class:`tuple`
 .. |namedtuple| replace:: :func:`namedtuple<collections.namedtuple>`
@@ -34,6 +35,7 @@
 .. |datetime| replace:: :class:`datetime.datetime`
 .. |timedelta| replace:: :class:`datetime.timedelta`
 .. |open| replace:: :func:`open()`
+.. |Executor| replace:: :class:`Executor<concurrent.futures.Executor>`
 .. |logging| replace:: :mod:`logging`
 .. |signal| replace:: :mod:`signal`
 .. |contextvars| replace:: :mod:`contextvars`
@@ -236,6 +238,7 @@ class Logger:
         backtrace=_defaults.LOGURU_BACKTRACE,
         diagnose=_defaults.LOGURU_DIAGNOSE,
         enqueue=_defaults.LOGURU_ENQUEUE,
+        defer_exceptions=_defaults.LOGURU_DEFER_EXCEPTIONS,
         catch=_defaults.LOGURU_CATCH,
         **kwargs
     ):
@@ -270,6 +273,10 @@ class Logger:
             Whether the messages to be logged should first pass through a multiprocess-safe queue
             before reaching the sink. This is useful while logging to a file through multiple
             processes. This also has the advantage of making logging calls non-blocking.
+        defer_exceptions : |bool|, optional
+            Whether the formatting of exceptions should be delegated to the thread consuming the
+            queue instead of being done by the logging call. It has no effect if ``enqueue`` is
+            ``False``.
         catch : |bool|, optional
             Whether errors occurring while sink handles logs messages should be automatically
             caught. If ``True``, an exception message is displayed on |sys.stderr| but the exception
@@ -307,6 +314,28 @@ class Logger:
         watch : |bool|, optional
             Whether or not the file should be watched and re-opened when deleted or changed (based
             on its device and inode properties) by an external program. It defaults to ``False``.
+        flush_interval : |str|, |int|, |float| or |timedelta|, optional
+            The maximum delay during which logged messages can be kept in memory before being
+            written to the file by a background thread.
+        flush_bytes : |str| or |int|, optional
+            The size of messages (in bytes) kept in memory beyond which they are written to the
+            file.
+        flush_level : |str| or |int|, optional
+            The minimum severity level from which a logged message causes the messages kept in
+            memory to be written to the file immediately.
+        size_resync : |str|, |int|, |float| or |timedelta|, optional
+            The interval at which the file size tracked for size-based ``rotation`` should be
+            refreshed from the file system, in case the file is also written by other programs.
+        background : |bool|, |str| or |Executor|, optional
+            Whether the ``compression`` and ``retention`` of rotated files should be executed in the
+            background instead of blocking the logging call. It can be ``"thread"`` (same as
+            ``True``), ``"process"`` or an already created executor. It defaults to ``False``.
+        background_backlog : |int|, optional
+            The maximum number of rotated files waiting to be processed in the background, beyond
+            which logging calls triggering a rotation will block. It defaults to ``16``.
+        background_callback : |callable|_, optional
+            A function called once a rotated file has been processed in the background. It should
+            accept two arguments: the path of the file and the exception raised (or ``None``).
         mode : |str|, optional
             The opening mode as for built-in |open| function. It defaults to ``"a"`` (open the
             file in appending mode).
@@ -590,7 +619,8 @@ class Logger:
         appending the date to its basename to prevent file overwriting. This parameter accepts:
 
         - an |int| which corresponds to the maximum file size in bytes before that the current
-          logged file is closed and a new one started over.
+          logged file is closed and a new one started over. The file size is tracked in memory by
+          the sink, use ``size_resync`` if the file is expected to be modified externally.
         - a |timedelta| which indicates the frequency of each new rotation.
         - a |time| which specifies the hour when the daily rotation should occur.
         - a |str| for human-friendly parametrization of one of the previously enumerated types.
@@ -622,6 +652,22 @@ class Logger:
           the log file as argument and process to whatever it wants (custom compression, network
           sending, removing it, etc.).
 
+        Built-in compression formats first write the archive in a temporary hidden directory, so
+        that a partially written archive never appears under its final name. Both compression and
+        retention can be moved out of the logging call using the ``background`` parameter: the new
+        file is opened immediately and old files are processed one after the other by the worker.
+        When using ``"process"``, the ``compression`` and ``retention`` functions must be
+        picklable. The sink waits for pending files to be processed when it is stopped.
+
+        By default, each logged message is written to the file immediately. The ``flush_interval``,
+        ``flush_bytes`` and ``flush_level`` parameters make the sink batch messages in memory and
+        write them together, reducing the number of system calls at the cost of possibly losing the
+        pending messages if the process crashes. As soon as one of these parameters is set, messages
+        are written when their accumulated size reaches ``flush_bytes`` (which defaults to
+        ``"64 KiB"``), when a message whose level is at least ``flush_level`` is logged, or when
+        ``flush_interval`` has elapsed (e.g. ``"200 ms"``). Pending messages are always written
+        before rotation and when the sink is stopped.
+
         Either way, if you use a custom function designed according to your preferences, you must be
         very careful not to use the ``logger`` within your function. Otherwise, there is a risk that
         your program hang because of a deadlock.
@@ -773,6 +819,10 @@ class Logger:
             if colorize is None:
                 colorize = False
 
+            flush_level = kwargs.get("flush_level", None)
+            if isinstance(flush_level, str):
+                kwargs["flush_level"] = self.level(flush_level).no
+
             wrapped_sink = FileSink(path, **kwargs)
             kwargs = {}
             encoding = wrapped_sink.encoding
@@ -968,6 +1018,7 @@ class Logger:
                 colorize=colorize,
                 serialize=serialize,
                 enqueue=enqueue,
+                defer_exceptions=defer_exceptions,
                 id_=handler_id,
                 error_interceptor=error_interceptor,
                 exception_formatter=exception_formatter,
@@ -265,3 +265,135 @@ def test_logging_not_unpicklable_exception():
     assert type_ is ValueError
     assert value is None
     assert traceback_ is None
+
+
+@pytest.mark.parametrize("diagnose", [True, False])
+@pytest.mark.parametrize("backtrace", [True, False])
+def test_defer_exceptions_same_output(writer, diagnose, backtrace):
+    def compute(value):
+        return 1 / value
+
+    options = dict(format="{message}", diagnose=diagnose, backtrace=backtrace)
+    logger.add(writer, enqueue=False, **options)
+    logger.add(writer, enqueue=True, defer_exceptions=True, **options)
+
+    try:
+        compute(0)
+    except ZeroDivisionError:
+        logger.exception("Error")
+
+    logger.complete()
+    logger.remove()
+
+    first, second = writer.written
+    assert first == second
+    assert first.splitlines()[-1] == "ZeroDivisionError: division by zero"
+
+
+def test_defer_exceptions_values_are_snapshot():
+    x = []
+
+    def slow_sink(message):
+        time.sleep(0.1)
+        x.append(message)
+
+    logger.add(slow_sink, format="{message}", enqueue=True, defer_exceptions=True, diagnose=True)
+
+    logger.info("Slow")
+
+    value = 0
+    try:
+        1 / value
+    except ZeroDivisionError:
+        logger.exception("Error")
+    value = 12345  # noqa: F841
+
+    logger.complete()
+    logger.remove()
+
+    assert len(x) == 2
+    assert "\u2514 0\n" in x[1]
+    assert "12345" not in x[1]
+
+
+def test_defer_exceptions_chained(writer):
+    logger.add(writer, format="{message}", enqueue=False)
+    logger.add(writer, format="{message}", enqueue=True, defer_exceptions=True)
+
+    def a():
+        raise ValueError("A")
+
+    def b():
+        try:
+            a()
+        except ValueError as e:
+            raise RuntimeError("B") from e
+
+    try:
+        b()
+    except RuntimeError:
+        logger.exception("Error")
+
+    logger.complete()
+    logger.remove()
+
+    first, second = writer.written
+    assert first == second
+    assert "ValueError: A" in first
+    assert "RuntimeError: B" in first
+
+
+def test_defer_exceptions_keep_ordering(writer):
+    logger.add(writer, format="{message}", enqueue=True, defer_exceptions=True)
+
+    logger.info("A")
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("B")
+    logger.info("C")
+
+    logger.complete()
+    logger.remove()
+
+    assert [m.splitlines()[0] for m in writer.written] == ["A", "B", "C"]
+
+
+def test_defer_exceptions_without_exception(writer):
+    logger.add(writer, format="{message}", enqueue=True, defer_exceptions=True)
+    logger.info("Test")
+    logger.complete()
+    assert writer.read() == "Test\n"
+
+
+def test_defer_exceptions_ignored_without_enqueue(writer):
+    logger.add(writer, format="{message}", enqueue=False, defer_exceptions=True)
+
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("Error")
+
+    assert writer.read().splitlines()[-1] == "ZeroDivisionError: division by zero"
+
+
+def test_defer_exceptions_caught_error_while_formatting(capsys):
+    def sink(message):
+        pass
+
+    logger.add(sink, format="{message} {extra[missing]}", enqueue=True, defer_exceptions=True)
+
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("Error")
+
+    logger.remove()
+
+    out, err = capsys.readouterr()
+    lines = err.strip().splitlines()
+    assert out == ""
+    assert lines[0] == "--- Logging error in Loguru Handler #0 ---"
+    assert re.match(r"Record was: \{.*Error.*\}", lines[1])
+    assert lines[-2] == "KeyError: 'missing'"
+    assert lines[-1] == "--- End of logging error ---"
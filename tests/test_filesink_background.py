@@ -0,0 +1,209 @@
+import gzip
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from loguru import logger
+
+from .conftest import check_dir
+
+
+def compress_then_remove(path):
+    with open(path, "rb") as f_in, gzip.open(path + ".gz", "wb") as f_out:
+        f_out.write(f_in.read())
+    os.remove(path)
+
+
+@pytest.mark.parametrize("background", [True, "thread", "process"])
+def test_background_compression(tmp_path, background):
+    logger.add(
+        tmp_path / "test.log", format="{message}", rotation=0, compression="gz", background=background
+    )
+    logger.info("A")
+    logger.info("B")
+    logger.remove()
+
+    files = sorted(f.name for f in tmp_path.iterdir())
+    assert len(files) == 3
+    assert all(f.endswith(".log.gz") for f in files)
+    contents = sorted(gzip.decompress(f.read_bytes()).decode() for f in tmp_path.iterdir())
+    assert contents == ["", "A\n", "B\n"]
+
+
+def test_background_does_not_block_writes(tmp_path):
+    event = threading.Event()
+    compressed = []
+
+    def compression(path):
+        event.wait()
+        compressed.append(path)
+
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", rotation=4, compression=compression, background=True)
+    logger.info("A")
+    logger.info("B")
+    logger.info("C")
+
+    assert file.read_text() == "B\n"
+    assert compressed == []
+
+    event.set()
+    logger.remove()
+
+    assert len(compressed) == 2
+
+
+def test_background_retention_ignores_active_file(tmp_path):
+    logger.add(tmp_path / "test.log", format="{message}", rotation=0, retention=0, background=True)
+    logger.info("A")
+    logger.info("B")
+    logger.complete()
+    time.sleep(0.1)
+    check_dir(tmp_path, files=[("test.log", "B\n")])
+
+
+def test_background_callback(tmp_path):
+    done = []
+
+    def callback(path, exception):
+        done.append((path, exception))
+
+    logger.add(
+        tmp_path / "test.log",
+        format="{message}",
+        rotation=0,
+        compression="gz",
+        background=True,
+        background_callback=callback,
+    )
+    logger.info("A")
+    logger.remove()
+
+    assert len(done) == 2
+    assert all(path.endswith(".log") and exception is None for path, exception in done)
+
+
+def test_background_callback_with_exception(tmp_path):
+    done = []
+
+    def compression(path):
+        raise ValueError("Compression error")
+
+    logger.add(
+        tmp_path / "test.log",
+        format="{message}",
+        compression=compression,
+        background=True,
+        background_callback=lambda path, exception: done.append(exception),
+    )
+    logger.info("A")
+    logger.remove()
+
+    assert len(done) == 1
+    assert isinstance(done[0], ValueError)
+
+
+def test_background_exception_without_callback(tmp_path, capsys):
+    def compression(path):
+        raise ValueError("Compression error")
+
+    logger.add(tmp_path / "test.log", format="{message}", compression=compression, background=True)
+    logger.info("A")
+    logger.remove()
+
+    out, err = capsys.readouterr()
+    lines = err.strip().splitlines()
+    assert out == ""
+    assert lines[0] == "--- Logging error in Loguru file sink worker ---"
+    assert lines[1] == "File was: %s" % (tmp_path / "test.log")
+    assert lines[-2] == "ValueError: Compression error"
+    assert lines[-1] == "--- End of logging error ---"
+
+
+def test_background_exception_in_callback(tmp_path, capsys):
+    def callback(path, exception):
+        raise ValueError("Callback error")
+
+    logger.add(
+        tmp_path / "test.log",
+        format="{message}",
+        compression="gz",
+        background=True,
+        background_callback=callback,
+    )
+    logger.remove()
+
+    out, err = capsys.readouterr()
+    lines = err.strip().splitlines()
+    assert out == ""
+    assert lines[0] == "--- Logging error in Loguru file sink worker ---"
+    assert lines[-2] == "ValueError: Callback error"
+
+
+def test_background_backlog(tmp_path):
+    event = threading.Event()
+
+    def compression(path):
+        event.wait()
+
+    logger.add(
+        tmp_path / "test.log",
+        format="{message}",
+        rotation=0,
+        compression=compression,
+        background=True,
+        background_backlog=1,
+    )
+
+    logger.info("A")  # Pending compression of the initial file.
+
+    thread = threading.Thread(target=logger.info, args=("B",))
+    thread.start()
+    thread.join(0.2)
+    assert thread.is_alive()
+
+    event.set()
+    thread.join()
+    logger.remove()
+
+
+def test_background_custom_executor(tmp_path):
+    executor = ThreadPoolExecutor(max_workers=1)
+    logger.add(
+        tmp_path / "test.log",
+        format="{message}",
+        compression=compress_then_remove,
+        background=executor,
+    )
+    logger.info("A")
+    logger.remove()
+
+    check_dir(tmp_path, files=[("test.log.gz", None)])
+    assert executor.submit(lambda: 42).result() == 42
+    executor.shutdown()
+
+
+@pytest.mark.parametrize("background", ["foo", "processes"])
+def test_invalid_background(tmp_path, background):
+    with pytest.raises(ValueError):
+        logger.add(tmp_path / "test.log", background=background)
+
+
+@pytest.mark.parametrize("background", [object(), 1, 2.5])
+def test_invalid_background_type(tmp_path, background):
+    with pytest.raises(TypeError):
+        logger.add(tmp_path / "test.log", background=background)
+
+
+@pytest.mark.parametrize("backlog", [0, -1, 1.5, "10"])
+def test_invalid_background_backlog(tmp_path, backlog):
+    with pytest.raises(ValueError):
+        logger.add(tmp_path / "test.log", background=True, background_backlog=backlog)
+
+
+def test_invalid_background_callback(tmp_path):
+    with pytest.raises(TypeError):
+        logger.add(tmp_path / "test.log", background=True, background_callback=42)
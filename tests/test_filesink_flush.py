@@ -0,0 +1,148 @@
+import datetime
+import time
+
+import pytest
+
+from loguru import logger
+
+
+def test_messages_kept_in_memory(tmp_path):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", flush_bytes=1000)
+    logger.info("A")
+    logger.info("B")
+    assert file.read_text() == ""
+    logger.remove()
+    assert file.read_text() == "A\nB\n"
+
+
+def test_flush_bytes(tmp_path):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", flush_bytes=6)
+    logger.info("A")
+    logger.info("B")
+    assert file.read_text() == ""
+    logger.info("C")
+    assert file.read_text() == "A\nB\nC\n"
+    logger.info("D")
+    assert file.read_text() == "A\nB\nC\n"
+    logger.remove()
+    assert file.read_text() == "A\nB\nC\nD\n"
+
+
+@pytest.mark.parametrize("size", ["6 B", "48b", 6.0])
+def test_flush_bytes_parsing(tmp_path, size):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", flush_bytes=size)
+    logger.info("AB")
+    logger.info("CD")
+    assert file.read_text() == "AB\nCD\n"
+
+
+def test_flush_bytes_encoded(tmp_path):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", flush_bytes=4, encoding="utf8")
+    logger.info("é")
+    assert file.read_text() == ""
+    logger.info("é")
+    assert file.read_text(encoding="utf8") == "é\né\n"
+
+
+@pytest.mark.parametrize("level", ["ERROR", 40])
+def test_flush_level(tmp_path, level):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", flush_level=level)
+    logger.info("A")
+    logger.warning("B")
+    assert file.read_text() == ""
+    logger.error("C")
+    assert file.read_text() == "A\nB\nC\n"
+    logger.critical("D")
+    assert file.read_text() == "A\nB\nC\nD\n"
+
+
+@pytest.mark.parametrize("interval", ["100 ms", 0.1, datetime.timedelta(milliseconds=100)])
+def test_flush_interval(tmp_path, interval):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", flush_interval=interval)
+    logger.info("A")
+    assert file.read_text() == ""
+
+    for _ in range(100):
+        time.sleep(0.05)
+        if file.read_text():
+            break
+
+    assert file.read_text() == "A\n"
+    logger.info("B")
+    logger.remove()
+    assert file.read_text() == "A\nB\n"
+
+
+def test_flush_before_rotation(tmp_path):
+    logger.add(tmp_path / "test.log", format="{message}", flush_bytes=1000, rotation=4)
+    logger.info("A")
+    logger.info("B")
+    logger.info("C")
+    logger.remove()
+
+    files = sorted(tmp_path.iterdir())
+    assert [f.read_text() for f in files] == ["A\nB\n", "C\n"]
+
+
+def test_flush_with_time_rotation(freeze_time, tmp_path):
+    with freeze_time("2020-01-01 12:00:00") as frozen:
+        file = tmp_path / "test.log"
+        logger.add(file, format="{message}", flush_bytes=1000, rotation="1 h")
+        logger.info("A")
+        assert file.read_text() == ""
+        frozen.tick(datetime.timedelta(hours=2))
+        logger.info("B")
+        logger.remove()
+
+        files = sorted(tmp_path.iterdir())
+        assert [f.read_text() for f in files] == ["A\n", "B\n"]
+
+
+def test_flush_with_enqueue(tmp_path):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", flush_bytes=1000, flush_interval=0.01, enqueue=True)
+    logger.info("A")
+    logger.complete()
+    logger.remove()
+    assert file.read_text() == "A\n"
+
+
+@pytest.mark.parametrize("interval", ["nope", "1 foobar", -1, 0])
+def test_invalid_flush_interval(tmp_path, interval):
+    with pytest.raises(ValueError):
+        logger.add(tmp_path / "test.log", flush_interval=interval)
+
+
+@pytest.mark.parametrize("interval", [object(), []])
+def test_invalid_flush_interval_type(tmp_path, interval):
+    with pytest.raises(TypeError):
+        logger.add(tmp_path / "test.log", flush_interval=interval)
+
+
+@pytest.mark.parametrize("size", ["nope", "1 foobar"])
+def test_invalid_flush_bytes(tmp_path, size):
+    with pytest.raises(ValueError):
+        logger.add(tmp_path / "test.log", flush_bytes=size)
+
+
+@pytest.mark.parametrize("size", [object(), []])
+def test_invalid_flush_bytes_type(tmp_path, size):
+    with pytest.raises(TypeError):
+        logger.add(tmp_path / "test.log", flush_bytes=size)
+
+
+def test_unknown_flush_level(tmp_path):
+    with pytest.raises(ValueError):
+        logger.add(tmp_path / "test.log", flush_level="foobar")
+
+
+@pytest.mark.parametrize("level", [object(), 3.5])
+def test_invalid_flush_level_type(tmp_path, level):
+    with pytest.raises(TypeError):
+        logger.add(tmp_path / "test.log", flush_level=level)
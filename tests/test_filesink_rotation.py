@@ -104,6 +104,78 @@ def test_size_rotation(freeze_time, tmp_path, size):
     )
 
 
+def test_size_rotation_existing_file(tmp_path):
+    file = tmp_path / "test.log"
+    file.write_text("abcdefgh\n")
+    logger.add(file, format="{message}", rotation=12)
+    logger.debug("ab")
+    logger.debug("cd")
+    logger.remove()
+
+    files = sorted(tmp_path.iterdir())
+    assert [f.read_text() for f in files] == ["abcdefgh\nab\n", "cd\n"]
+
+
+def test_size_rotation_encoded_length(tmp_path):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", rotation=6, encoding="utf8")
+    logger.debug("\u00e9\u00e9")
+    logger.debug("a")
+    logger.remove()
+
+    files = sorted(tmp_path.iterdir())
+    assert [f.read_text(encoding="utf8") for f in files] == ["\u00e9\u00e9\n", "a\n"]
+
+
+def test_size_rotation_does_not_query_file(tmp_path, monkeypatch):
+    logger.add(tmp_path / "test.log", format="{message}", rotation=1000)
+    monkeypatch.setattr(os, "stat", Mock(side_effect=RuntimeError("Unexpected stat")))
+    monkeypatch.setattr(os, "fstat", Mock(side_effect=RuntimeError("Unexpected fstat")))
+    logger.debug("a")
+    logger.debug("b")
+    monkeypatch.undo()
+    logger.remove()
+
+
+def test_size_rotation_external_writes_ignored(tmp_path):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", rotation=10)
+    logger.debug("ab")
+    with file.open("a") as f:
+        f.write("cdefghij\n")
+    logger.debug("kl")
+    logger.remove()
+
+    assert file.read_text() == "ab\ncdefghij\nkl\n"
+
+
+@pytest.mark.parametrize("size_resync", [0.001, "1 ms", datetime.timedelta(milliseconds=1)])
+def test_size_rotation_external_writes_resync(tmp_path, size_resync):
+    file = tmp_path / "test.log"
+    logger.add(file, format="{message}", rotation=10, size_resync=size_resync)
+    logger.debug("ab")
+    with file.open("a") as f:
+        f.write("cdefghij\n")
+    time.sleep(0.01)
+    logger.debug("kl")
+    logger.remove()
+
+    files = sorted(tmp_path.iterdir())
+    assert [f.read_text() for f in files] == ["ab\ncdefghij\n", "kl\n"]
+
+
+@pytest.mark.parametrize("size_resync", ["foobar", -1, 0])
+def test_invalid_size_resync(tmp_path, size_resync):
+    with pytest.raises(ValueError):
+        logger.add(tmp_path / "test.log", rotation=10, size_resync=size_resync)
+
+
+@pytest.mark.parametrize("size_resync", [object(), []])
+def test_invalid_size_resync_type(tmp_path, size_resync):
+    with pytest.raises(TypeError):
+        logger.add(tmp_path / "test.log", rotation=10, size_resync=size_resync)
+
+
 @pytest.mark.parametrize(
     "when, hours",
     [
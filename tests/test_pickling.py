@@ -202,6 +202,21 @@ def test_pickling_file_handler_compression(tmp_path, compression):
     assert file.read_text() == "DEBUG - test_pickling_file_handler_compression - A message\n"
 
 
+def test_pickling_file_handler_flush(tmp_path):
+    file = tmp_path / "test.log"
+    logger.add(
+        file,
+        format="{level} - {function} - {message}",
+        delay=True,
+        flush_interval=0.1,
+        flush_level=0,
+    )
+    pickled = pickle.dumps(logger)
+    unpickled = pickle.loads(pickled)
+    unpickled.debug("A message")
+    assert file.read_text() == "DEBUG - test_pickling_file_handler_flush - A message\n"
+
+
 def test_pickling_no_handler(writer):
     pickled = pickle.dumps(logger)
     unpickled = pickle.loads(pickled)